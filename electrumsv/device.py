@@ -292,7 +292,7 @@ class DeviceMgr:
                     'application is using it.\n\nTry to connect again?').format(plugin.device)
             if not handler.yes_no_question(msg):
                 raise UserCancelled()
-            devices = None
+            devices = self.scan_devices(fresh=True)
         if len(infos) == 1:
             return infos[0]
         # select device by label
@@ -347,15 +347,19 @@ class DeviceMgr:
                                     transport_ui_string='hid'))
         return devices
 
-    def scan_devices(self):
+    def scan_devices(self, fresh: bool=False):
+        '''Pass `fresh` when the user has asked for a rescan, so that a device they have just
+        connected is not missed because of a recent cached enumeration.'''
         logger.debug("scanning devices...")
 
         # Let plugins enumerate devices
         devices = []
         for vendor, plugin in self.supported_devices().items():
             if not isinstance(plugin, Exception):
+                if fresh:
+                    plugin.invalidate_device_cache()
                 try:
-                    devices.extend(plugin.enumerate_devices())
+                    devices.extend(plugin.enumerate_devices_cached())
                 except Exception as e:
                     logger.exception(f"Failed to enumerate devices from {vendor} plugin")
 
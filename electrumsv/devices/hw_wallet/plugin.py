@@ -24,8 +24,8 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import threading
-from typing import Any, Dict, TYPE_CHECKING
+import time
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from electrumsv.i18n import _
 from electrumsv.logs import logs
@@ -34,19 +34,24 @@ from electrumsv.util import versiontuple
 from .cmdline import CmdLineHandler
 
 if TYPE_CHECKING:
+    from electrumsv.device import Device
     from electrumsv.keystore import KeyStore
     from electrumsv.wallet_database.tables import MasterKeyRow
 
 class HW_PluginBase(object):
     keystore_class: Any
     libraries_available_message: str
-
-    hid_lock = threading.Lock()
+    # The supported range of versions for the 3rd party library, for plugins that check it.
+    minimum_library: Tuple[int, ...] = (0,)
+    maximum_library: Optional[Tuple[int, ...]] = None
+    # Device scans within this many seconds of an enumeration reuse its results.
+    enumeration_cache_seconds = 1.5
 
     def __init__(self, device_kind) -> None:
         self.device: Any = self.keystore_class.device
         self.name = device_kind
         self.logger = logs.get_logger(device_kind)
+        self._enumeration_cache: Optional[Tuple[float, List['Device']]] = None
 
     def create_keystore(self, data: Dict[str, Any], row: 'MasterKeyRow') -> 'KeyStore':
         keystore = self.keystore_class(data, row)
@@ -79,23 +84,24 @@ class HW_PluginBase(object):
             # this might raise ImportError or LibraryFoundButUnusable
             library_version = self.get_library_version()
             # if no exception so far, we might still raise LibraryFoundButUnusable
-            if (library_version == 'unknown' or
-                    versiontuple(library_version) < self.minimum_library or  # type: ignore
-                    hasattr(self, "maximum_library") and
-                    versiontuple(library_version) > self.maximum_library):  # type: ignore
+            if library_version == 'unknown':
+                raise LibraryFoundButUnusable(library_version=library_version)
+            parsed_version = versiontuple(library_version)
+            if (parsed_version < self.minimum_library or
+                    self.maximum_library is not None and parsed_version > self.maximum_library):
                 raise LibraryFoundButUnusable(library_version=library_version)
         except ImportError:
             return False
         except LibraryFoundButUnusable as e:
             library_version = e.library_version
-            max_version_str = (version_str(self.maximum_library)  # type: ignore
-                               if hasattr(self, "maximum_library") else "inf")
+            max_version_str = (version_str(self.maximum_library)
+                               if self.maximum_library is not None else "inf")
             self.libraries_available_message = (
                     _("Library version for '{}' is incompatible.").format(self.name)
                     + '\nInstalled: {}, Needed: {} <= x < {}'
                     .format(library_version,
-                            version_str(self.minimum_library),  # type: ignore
-                            max_version_str))  # type: ignore
+                            version_str(self.minimum_library),
+                            max_version_str))
             self.logger.warning(self.libraries_available_message)
             return False
 
@@ -112,6 +118,21 @@ class HW_PluginBase(object):
     def enumerate_devices(self):
         raise NotImplementedError
 
+    def enumerate_devices_cached(self) -> List['Device']:
+        '''Enumerating devices goes through the USB and HID libraries which is slow, and a single
+        user action like signing can result in several scans in quick succession.'''
+        now = time.monotonic()
+        if self._enumeration_cache is not None:
+            enumerated_time, devices = self._enumeration_cache
+            if now - enumerated_time < self.enumeration_cache_seconds:
+                return devices
+        devices = self.enumerate_devices()
+        self._enumeration_cache = now, devices
+        return devices
+
+    def invalidate_device_cache(self) -> None:
+        self._enumeration_cache = None
+
 
 class LibraryFoundButUnusable(Exception):
     def __init__(self, library_version='unknown'):
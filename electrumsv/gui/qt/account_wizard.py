@@ -117,7 +117,6 @@ def request_password(parent: Optional[QWidget], storage: WalletStorage) -> Optio
 class AccountWizard(BaseWizard, MessageBoxMixin):
     HELP_DIRNAME = "account-wizard"
 
-    _last_page_id: Optional[AccountPage] = None
     _selected_device: Optional[Tuple[str, DeviceInfo]] = None
     _keystore: Optional[KeyStore] = None
     _keystore_type = ResultType.UNKNOWN
@@ -1009,7 +1008,7 @@ class FindHardwareWalletAccountPage(QWizardPage):
         debug_msg = ''
         supported_devices = devmgr.supported_devices()
         try:
-            scanned_devices = devmgr.scan_devices()
+            scanned_devices = devmgr.scan_devices(fresh=True)
         except Exception:
             logger.exception(f'error scanning devices')
         else:
@@ -23,9 +23,11 @@
 # SOFTWARE.
 
 from decimal import Decimal
+from functools import lru_cache
+import re
 from typing import Optional
 
-from PyQt5.QtCore import pyqtSignal, Qt
+from PyQt5.QtCore import pyqtSignal, QEvent, Qt
 from PyQt5.QtGui import QPalette, QPainter
 from PyQt5.QtWidgets import (QLineEdit, QStyle, QStyleOptionFrame)
 
@@ -33,6 +35,25 @@ from electrumsv.app_state import app_state
 from electrumsv.util import format_satoshis_plain
 
 
+# Anything that is not a digit or a decimal point is stripped from entered amounts.
+_NON_NUMERIC_RE = re.compile(r'[^0-9.]')
+
+
+@lru_cache(maxsize=16)
+def pow10(decimal_point: int) -> int:
+    """The multiplier that converts an amount in the given unit to satoshis."""
+    return 10 ** decimal_point
+
+
+def clean_amount_text(text: str, decimal_point: int) -> str:
+    """Reduce text to digits with at most one decimal point and `decimal_point` decimals."""
+    s = _NON_NUMERIC_RE.sub('', text)
+    whole, point, fraction = s.partition('.')
+    if point:
+        s = whole + '.' + fraction.replace('.', '')[:decimal_point]
+    return s
+
+
 class MyLineEdit(QLineEdit):
     frozen = pyqtSignal()
 
@@ -52,23 +73,34 @@ class AmountEdit(MyLineEdit):
         self.base_unit_func = base_unit_func
         self.textChanged.connect(self.numbify)
         self.is_shortcut = False
+        self._update_help_color()
+
+    def _update_help_color(self) -> None:
         self.help_palette = QPalette()
+        self._help_color = self.help_palette.brush(QPalette.Disabled, QPalette.Text).color()
+
+    def changeEvent(self, event: QEvent) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.PaletteChange:
+            self._update_help_color()
 
     def decimal_point(self):
         return 8
 
     def numbify(self):
-        text = self.text().strip()
+        raw_text = text = self.text()
+        # Only strip when there is whitespace to strip, which is rarely.
+        if text and (text[0] <= ' ' or text[-1] <= ' '):
+            text = text.strip()
         if text == '!':
             self.shortcut.emit()
             return
         pos = self.cursorPosition()
-        chars = '0123456789.'
-        s = ''.join([i for i in text if i in chars])
-        if '.' in s:
-            p = s.find('.')
-            s = s.replace('.','')
-            s = s[:p] + '.' + s[p: p + self.decimal_point()]
+        s = clean_amount_text(text, self.decimal_point())
+        if s == raw_text:
+            # This is the normal case for typed input and amounts that are set.
+            self.setModified(self.hasFocus())
+            return
         self.setText(s)
         # setText sets Modified to False.  Instead we want to remember
         # if updates were because of user modification.
@@ -83,12 +115,12 @@ class AmountEdit(MyLineEdit):
             textRect = self.style().subElementRect(QStyle.SE_LineEditContents, panel, self)
             textRect.adjust(2, 0, -10, 0)
             painter = QPainter(self)
-            painter.setPen(self.help_palette.brush(QPalette.Disabled, QPalette.Text).color())
+            painter.setPen(self._help_color)
             painter.drawText(textRect, Qt.AlignRight | Qt.AlignVCenter, self.base_unit_func())
 
     def get_amount(self):
         try:
-            return Decimal(str(self.text()))
+            return Decimal(self.text())
         except Exception:
             return None
 
@@ -101,12 +133,19 @@ class BTCAmountEdit(AmountEdit):
         return app_state.decimal_point
 
     def get_amount(self) -> Optional[int]:
+        text = self.text().strip()
+        p = pow10(self.decimal_point())
+        # Whole amounts do not need to go through `Decimal`.
+        if '.' not in text:
+            try:
+                return int(text) * p
+            except ValueError:
+                return None
+
         try:
-            x = Decimal(str(self.text()))
+            x = Decimal(text)
         except Exception:
             return None
-
-        p = pow(10, self.decimal_point())
         return int( p * x )
 
     def setAmount(self, amount: int) -> None:
@@ -128,9 +167,10 @@ class BTCSatsByteEdit(AmountEdit):
         return 'sats/B'
 
     def get_amount(self):
+        # `numbify` only allows digits and a decimal point, so there is no need for `Decimal`.
         try:
-            x = float(Decimal(str(self.text())))
-        except Exception:
+            x = float(self.text())
+        except ValueError:
             return None
         return x if x > 0.0 else None
 
@@ -138,4 +178,4 @@ class BTCSatsByteEdit(AmountEdit):
         if amount is None:
             self.setText(" ") # Space forces repaint in case units changed
         else:
-            self.setText(str(round(amount*100.0)/100.0))
+            self.setText(f"{amount:.2f}")
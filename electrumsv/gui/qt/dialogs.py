@@ -23,6 +23,9 @@
 
 import enum
 import time
+import types
+from typing import Any, Dict
+import weakref
 
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QMessageBox, QCheckBox
@@ -35,15 +38,24 @@ class DisplayFrequency(enum.Enum):
     OncePerRun = 2
 
 
+# Once a box is suppressed the saved answer does not change, so it does not need to be read
+# from the wallet storage or config again. Wallet answers are held against the wallet object,
+# so they go away with it and a new wallet at the same path does not inherit them.
+_config_suppressed_values: Dict[str, Any] = {}
+_wallet_suppressed_values: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = \
+    weakref.WeakKeyDictionary()
+
+
 class BoxBase(object):
-    display_frequency = DisplayFrequency.Always
+    __slots__ = ('name', 'main_text', 'info_text', 'display_frequency')
+
     last_shown = {}
 
     def __init__(self, name, main_text, info_text, frequency=None):
         self.name = name
         self.main_text = main_text
         self.info_text = info_text
-        self.display_frequency = frequency or self.display_frequency
+        self.display_frequency = frequency or DisplayFrequency.Always
 
     def result(self, parent, wallet, **kwargs):
         '''Return the result of the suppressible box.  If this is saved in the configuration
@@ -55,9 +67,17 @@ class BoxBase(object):
 
         key = f'suppress_{self.name}'
         if wallet:
-            value = wallet.get_storage().get(key, None)
+            suppressed_values = _wallet_suppressed_values.setdefault(wallet, {})
         else:
-            value = app_state.config.get(key, None)
+            suppressed_values = _config_suppressed_values
+        value = suppressed_values.get(key)
+        if value is None:
+            if wallet:
+                value = wallet.get_storage().get(key, None)
+            else:
+                value = app_state.config.get(key, None)
+            if value is not None:
+                suppressed_values[key] = value
 
         if value is None:
             set_it, value = self.show_dialog(parent, **kwargs)
@@ -66,6 +86,7 @@ class BoxBase(object):
                     wallet.get_storage().put(key, value)
                 else:
                     app_state.config.set_key(key, value, True)
+                suppressed_values[key] = value
 
             self.__class__.last_shown[self.name] = time.time(), value
 
@@ -90,6 +111,8 @@ class BoxBase(object):
 
 
 class InfoBox(BoxBase):
+    __slots__ = ()
+
     icon = QMessageBox.Information
 
     def show_dialog(self, parent, **kwargs):
@@ -101,10 +124,14 @@ class InfoBox(BoxBase):
 
 
 class WarningBox(InfoBox):
+    __slots__ = ()
+
     icon = QMessageBox.Warning
 
 
 class YesNoBox(BoxBase):
+    __slots__ = ('yes_text', 'no_text', 'default')
+
     icon = QMessageBox.Question
 
     def __init__(self, name, main_text, info_text, yes_text, no_text, default, frequency=None):
@@ -164,7 +191,7 @@ all_boxes = [
         ))),
 ]
 
-all_boxes_by_name = {box.name: box for box in all_boxes}
+all_boxes_by_name = types.MappingProxyType({box.name: box for box in all_boxes})
 
 
 def _set_window_title_and_icon(dialog):
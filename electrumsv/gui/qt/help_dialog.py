@@ -15,17 +15,23 @@ class HelpDialog(WindowModalDialog):
         self.setMinimumSize(450, 400)
 
         source_path = text_resource_path(help_dirname, f"{help_file_name}.html")
+        self._source_url = QUrl.fromLocalFile(source_path)
 
-        widget = QTextBrowser()
+        self._browser = widget = QTextBrowser()
         widget.document().setDocumentMargin(15)
         widget.setOpenLinks(True)
         widget.setOpenExternalLinks(True)
         widget.setAcceptRichText(True)
-        widget.setSource(QUrl.fromLocalFile(source_path))
+        widget.setSource(self._source_url)
 
         vbox = QVBoxLayout(self)
         vbox.addWidget(widget)
         vbox.addLayout(Buttons(OkButton(self)))
 
+    def reset(self) -> None:
+        '''Return to the top of the original help file, discarding any links followed.'''
+        self._browser.setSource(self._source_url)
+        self._browser.clearHistory()
+
     def run(self):
         return self.exec_()
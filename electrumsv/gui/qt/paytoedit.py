@@ -25,12 +25,12 @@
 
 import time
 from decimal import Decimal, InvalidOperation
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING, Union
 
 from bitcoinx import Address, cashaddr, Script, ScriptError
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFontMetrics, QTextCursor
+from PyQt5.QtCore import QEvent, Qt, QTimer
+from PyQt5.QtGui import QFocusEvent, QFontMetrics, QTextCursor
 from PyQt5.QtWidgets import QCompleter, QPlainTextEdit
 
 from electrumsv.bitcoin import string_to_bip276_script
@@ -43,6 +43,7 @@ from electrumsv.network import Net
 from electrumsv.transaction import XTxOutput
 from electrumsv.web import is_URI, URIError
 
+from .amountedit import pow10
 from .qrtextedit import ScanQRTextEdit
 from . import util
 
@@ -57,6 +58,15 @@ logger = logs.get_logger("ui.paytoedit")
 frozen_style = "QWidget { background-color:none; border:none;}"
 normal_style = "QPlainTextEdit { }"
 
+BIP276_SCRIPT_PREFIX = PREFIX_BIP276_SCRIPT + ":"
+
+# The number of parsed payment destinations to remember before starting afresh.
+MAX_PARSE_CACHE_ENTRIES = 512
+# Typing any of these characters ends the word being completed.
+END_OF_WORD = frozenset("~!@#$%^&*()_+{}|:\"<>?,./;'[]\\-=")
+# How long the user has to stop typing for before their destinations are parsed.
+REPARSE_DELAY_MS = 150
+
 class PayToEdit(ScanQRTextEdit):
     ''' timestamp indicating when the user was last warned about using cash addresses. '''
     last_cashaddr_warning = None
@@ -66,18 +76,35 @@ class PayToEdit(ScanQRTextEdit):
 
         self._send_view = send_view
         # self._main_window = send_view._main_window
+        # The split lines of the document are kept until it is next changed.
+        self._lines_cache: Optional[List[str]] = None
+        self.document().contentsChanged.connect(self._invalidate_lines)
         self.document().contentsChanged.connect(self.update_size)
         self.heightMin = 0
         self.heightMax = 150
+        self._line_height: Optional[int] = None
         self._completer = None
+        # Parsing the destinations and updating the fee is too expensive to do on every keystroke,
+        # so it is deferred until the user stops typing. Anything that needs the parsed results
+        # applies any pending edits first.
+        self._reparse_timer = QTimer(self)
+        self._reparse_timer.setSingleShot(True)
+        self._reparse_timer.setInterval(REPARSE_DELAY_MS)
+        self._reparse_timer.timeout.connect(self._do_reparse)
         self.textChanged.connect(self._on_text_changed)
         self._outputs: List[XTxOutput] = []
         self._errors = []
         # Accessed by the send view.
         self.is_pr = False
         self._ignore_uris = False
+        # The text that the current outputs and errors were parsed from.
+        self._last_text: Optional[str] = None
         self.update_size()
         self._payto_script: Optional[Script] = None
+        # Parsing a destination may involve decoding an address or script, and every edit results
+        # in every line being parsed again. The result for each distinct destination text is kept,
+        # which is either the script or the message for the error that parsing it raised.
+        self._parse_cache: Dict[str, Union[Script, str]] = {}
 
     def setFrozen(self, b):
         self.setReadOnly(b)
@@ -96,31 +123,39 @@ class PayToEdit(ScanQRTextEdit):
         cash addresses are not in the future for BSV. Anyone who uses one should be warned that
         they are being phased out, in order to encourage them to pre-emptively move on.
         '''
+        # There is no need to decode the address if the user was warned recently.
+        last_check_time = PayToEdit.last_cashaddr_warning
+        ignore_watermark_time = time.time() - 24 * 60 * 60
+        if last_check_time is not None and last_check_time >= ignore_watermark_time:
+            return
+
+        # Cash addresses without the "prefix:" separator do not decode, so base58 addresses can
+        # be ruled out without raising and catching a decoding error.
+        if ':' not in address_text:
+            return
+
         # We only care if it is decoded, as this will be a cash address.
         try:
             cashaddr.decode(address_text)
         except Exception:
             return
 
-        last_check_time = PayToEdit.last_cashaddr_warning
-        ignore_watermark_time = time.time() - 24 * 60 * 60
-        if last_check_time is None or last_check_time < ignore_watermark_time:
-            PayToEdit.last_cashaddr_warning = time.time()
-
-            message = ("<p>"+
-                _("One or more of the addresses you have provided has been recognized "+
-                "as a 'cash address'. For now, this is acceptable but is recommended that you get "+
-                "in the habit of requesting that anyone who provides you with payment addresses "+
-                "do so in the form of normal Bitcoin SV addresses.")+
-                "</p>"+
-                "<p>"+
-                _("Within the very near future, various services and applications in the Bitcoin "+
-                "SV ecosystem will stop accepting 'cash addresses'. It is in your best interest "+
-                "to make sure you transition over to normal Bitcoin SV addresses as soon as "+
-                "possible, in order to ensure that you can both be paid, and also get paid.")+
-                "</p>"
-                )
-            util.MessageBox.show_warning(message, title=_("Cash address warning"))
+        PayToEdit.last_cashaddr_warning = time.time()
+
+        message = ("<p>"+
+            _("One or more of the addresses you have provided has been recognized "+
+            "as a 'cash address'. For now, this is acceptable but is recommended that you get "+
+            "in the habit of requesting that anyone who provides you with payment addresses "+
+            "do so in the form of normal Bitcoin SV addresses.")+
+            "</p>"+
+            "<p>"+
+            _("Within the very near future, various services and applications in the Bitcoin "+
+            "SV ecosystem will stop accepting 'cash addresses'. It is in your best interest "+
+            "to make sure you transition over to normal Bitcoin SV addresses as soon as "+
+            "possible, in order to ensure that you can both be paid, and also get paid.")+
+            "</p>"
+            )
+        util.MessageBox.show_warning(message, title=_("Cash address warning"))
 
     def _parse_tx_output(self, line: str) -> XTxOutput:
         try:
@@ -128,7 +163,7 @@ class PayToEdit(ScanQRTextEdit):
         except ValueError:
             raise InvalidPayToError(_("Invalid payment destination: {}").format(line))
 
-        script = self._parse_output(x)
+        script = self._parse_output_cached(x)
         try:
             amount = self._parse_amount(y)
         except InvalidOperation:
@@ -136,16 +171,29 @@ class PayToEdit(ScanQRTextEdit):
 
         return XTxOutput(amount, script)
 
-    def _parse_output(self, text: str) -> Script:
+    def _parse_output_cached(self, text: str) -> Script:
         # raises InvalidPayToError
-        try:
-            address = Address.from_string(text, Net.COIN)
-            self._show_cashaddr_warning(text)
-            return address.to_script()
-        except ValueError:
-            pass
+        entry = self._parse_cache.get(text)
+        if entry is None:
+            try:
+                entry = self._parse_output(text)
+            except InvalidPayToError as e:
+                entry = e.args[0]
+            if len(self._parse_cache) >= MAX_PARSE_CACHE_ENTRIES:
+                self._parse_cache.clear()
+            self._parse_cache[text] = entry
+        if isinstance(entry, str):
+            raise InvalidPayToError(entry)
+        # This is done for cached results as well, so that the user is still warned if they
+        # use a cash address again after the warning period has passed.
+        self._show_cashaddr_warning(text)
+        return entry
 
-        if text.startswith(PREFIX_BIP276_SCRIPT +":"):
+    def _parse_output(self, text: str) -> Script:
+        # raises InvalidPayToError
+        # Neither script prefix can start a valid address, so these are checked first to avoid
+        # raising and catching an address parsing error for them.
+        if text.startswith(BIP276_SCRIPT_PREFIX):
             try:
                 return string_to_bip276_script(text)
             except ValueError as e:
@@ -157,13 +205,28 @@ class PayToEdit(ScanQRTextEdit):
             except ScriptError as e:
                 raise InvalidPayToError(e.args[0])
 
+        try:
+            address = Address.from_string(text, Net.COIN)
+            return address.to_script()
+        except ValueError:
+            pass
+
         raise InvalidPayToError(_("Unrecognized payment destination: {}").format(text))
 
     def _parse_amount(self, x):
-        if x.strip() == '!':
+        # raises InvalidOperation
+        x = x.strip()
+        if x == '!':
             return all
-        p = pow(10, self._send_view.amount_e.decimal_point())
-        return int(p * Decimal(x.strip()))
+        p = pow10(self._send_view.amount_e.decimal_point())
+        # Whole amounts do not need to go through `Decimal`, anything `int` rejects is left for
+        # it to reject.
+        if '.' not in x:
+            try:
+                return int(x) * p
+            except ValueError:
+                pass
+        return int(p * Decimal(x))
 
     def setPlainText(self, text: str, ignore_uris: bool=False) -> None:
         # We override this so that there's no infinite loop where pay_to_URI calls this then
@@ -171,14 +234,37 @@ class PayToEdit(ScanQRTextEdit):
         self._ignore_uris = ignore_uris
         try:
             super().setPlainText(text)
+            # Programmatic changes are applied immediately, only user edits are deferred.
+            self._flush_reparse()
         finally:
             self._ignore_uris = False
 
-    def _on_text_changed(self):
-        self._errors = []
+    def focusOutEvent(self, event: QFocusEvent) -> None:
+        self._flush_reparse()
+        super().focusOutEvent(event)
+
+    def _on_text_changed(self) -> None:
+        self._reparse_timer.start()
+
+    def _flush_reparse(self) -> None:
+        if self._reparse_timer.isActive():
+            self._reparse_timer.stop()
+            self._do_reparse()
+
+    def _do_reparse(self) -> None:
         if self.is_pr:
+            self._errors = []
+            # Whatever text is present next time it is not a payment request needs parsing.
+            self._last_text = None
             return
 
+        # Qt emits `textChanged` in cases where the text is not actually different.
+        text = self.toPlainText()
+        if text == self._last_text:
+            return
+        self._last_text = text
+
+        self._errors = []
         self._payto_script = None
 
         # filter out empty lines
@@ -190,7 +276,7 @@ class PayToEdit(ScanQRTextEdit):
                 return
 
             try:
-                self._payto_script = self._parse_output(data)
+                self._payto_script = self._parse_output_cached(data)
             except InvalidPayToError:
                 # We don't need to capture this error as it will be caught in the multiple-line
                 # case for display.
@@ -219,19 +305,26 @@ class PayToEdit(ScanQRTextEdit):
         self._outputs = outputs
         self._payto_script = None
 
-        if self._send_view.get_is_spending_maximum():
-            self._send_view.do_update_fee()
-        else:
-            self._send_view.amount_e.setAmount(total if outputs else None)
+        # The text change that led here has already scheduled the send view's coalesced fee
+        # update, so spending the maximum does not need to calculate the fee directly as well.
+        if not self._send_view.get_is_spending_maximum():
+            amount = total if outputs else None
+            # Setting the same amount again would only cascade through the amount edit's
+            # signal handlers for no effect.
+            if amount is None or self._send_view.amount_e.get_amount() != amount:
+                self._send_view.amount_e.setAmount(amount)
             self._send_view.lock_amount(total or len(lines)>1)
 
     def get_errors(self):
+        self._flush_reparse()
         return self._errors
 
     def get_payee_script(self) -> Optional[Script]:
+        self._flush_reparse()
         return self._payto_script
 
     def get_outputs(self, is_max):
+        self._flush_reparse()
         if self._payto_script is not None:
             if is_max:
                 amount = all
@@ -240,8 +333,13 @@ class PayToEdit(ScanQRTextEdit):
             self._outputs = [XTxOutput(amount, self._payto_script)]
         return self._outputs[:]
 
-    def _lines(self):
-        return self.toPlainText().split('\n')
+    def _invalidate_lines(self) -> None:
+        self._lines_cache = None
+
+    def _lines(self) -> List[str]:
+        if self._lines_cache is None:
+            self._lines_cache = self.toPlainText().split('\n')
+        return self._lines_cache
 
     def _is_multiline(self):
         return len(self._lines()) > 1
@@ -250,8 +348,16 @@ class PayToEdit(ScanQRTextEdit):
         self.setText("\n\n\n")
         self.update_size()
 
+    def changeEvent(self, event: QEvent) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.FontChange:
+            self._line_height = None
+
     def update_size(self):
-        lineHeight = QFontMetrics(self.document().defaultFont()).height()
+        # This is called on every edit, and the line height only changes with the font.
+        if self._line_height is None:
+            self._line_height = QFontMetrics(self.document().defaultFont()).height()
+        lineHeight = self._line_height
         docHeight = int(self.document().size().height())
         h = docHeight * lineHeight + 11
         if self.heightMin <= h <= self.heightMax:
@@ -299,15 +405,15 @@ class PayToEdit(ScanQRTextEdit):
 
         QPlainTextEdit.keyPressEvent(self, e)
 
-        ctrlOrShift = e.modifiers() and (Qt.ControlModifier or Qt.ShiftModifier)
+        modifiers = e.modifiers()
+        ctrlOrShift = modifiers and (Qt.ControlModifier or Qt.ShiftModifier)
         if self._completer is None or (ctrlOrShift and not e.text()):
             return
 
-        eow = "~!@#$%^&*()_+{}|:\"<>?,./;'[]\\-="
-        hasModifier = (e.modifiers() != Qt.NoModifier) and not ctrlOrShift
+        hasModifier = (modifiers != Qt.NoModifier) and not ctrlOrShift
         completionPrefix = self._get_text_under_cursor()
 
-        if hasModifier or not e.text() or len(completionPrefix) < 1 or eow.find(e.text()[-1]) >= 0:
+        if hasModifier or not e.text() or len(completionPrefix) < 1 or e.text()[-1] in END_OF_WORD:
             self._completer.popup().hide()
             return
 
@@ -175,7 +175,6 @@ class WalletWizard(BaseWizard):
     """
     HELP_DIRNAME = "wallet-wizard"
 
-    _last_page_id = WalletPage.NONE
     _wallet_type = StorageKind.UNKNOWN
     _wallet_path: Optional[str] = None
     _password_state = PasswordState.UNKNOWN
@@ -1,7 +1,7 @@
-from typing import NamedTuple, Optional
+from typing import Dict, NamedTuple, Optional, Tuple
 
 from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QWidget, QWizard
+from PyQt5.QtWidgets import QWidget, QWizard, QWizardPage
 
 from electrumsv.constants import IntFlag
 
@@ -32,6 +32,28 @@ class HelpContext(NamedTuple):
     file_name: str
 
 
+class WizardPageInfo(NamedTuple):
+    page: QWizardPage
+    has_on_leave: bool
+    help_context: Optional[HelpContext]
+    has_on_enter: bool
+
+
+# The capabilities of a page are defined by its class, so they are only probed for the first
+# page of each class that gets added to any wizard.
+_page_class_capabilities: Dict[type, Tuple[bool, Optional[HelpContext], bool]] = {}
+
+
+def _get_page_capabilities(page: QWizardPage) -> Tuple[bool, Optional[HelpContext], bool]:
+    page_class = type(page)
+    capabilities = _page_class_capabilities.get(page_class)
+    if capabilities is None:
+        capabilities = (hasattr(page_class, "on_leave"),
+            getattr(page_class, "HELP_CONTEXT", None), hasattr(page_class, "on_enter"))
+        _page_class_capabilities[page_class] = capabilities
+    return capabilities
+
+
 class BaseWizard(QWizard):
     HELP_DIRNAME: str
 
@@ -39,21 +61,35 @@ class BaseWizard(QWizard):
         super().__init__(parent, Qt.WindowSystemMenuHint | Qt.WindowTitleHint |
             Qt.WindowCloseButtonHint)
 
-        self.setOption(QWizard.IndependentPages, False)
-        self.setOption(QWizard.NoDefaultButton, True)
-        # The help button is either made visible or hidden when a page is entered, depending
-        # on whether the page declares a `HELP_CONTEXT` value.
-        self.setOption(QWizard.HaveHelpButton, True)
-        self.setOption(QWizard.HelpButtonOnRight, False)
-
-        self.currentIdChanged.connect(self._event_wizard_page_changed)
-        self.helpRequested.connect(self._event_help_requested)
+        # The common options and page change wiring are applied when the wizard is first shown,
+        # as not every wizard that is constructed ends up being shown.
+        self._wired = False
+        self._last_page_id: Optional[int] = None
+        self._help_dialogs: Dict[Tuple[str, str], HelpDialog] = {}
+        self._page_infos: Dict[int, WizardPageInfo] = {}
 
     def run(self):
         self.ensure_shown()
         return self.exec()
 
     def ensure_shown(self) -> None:
+        if not self._wired:
+            self._wired = True
+            self.setOption(QWizard.IndependentPages, False)
+            self.setOption(QWizard.NoDefaultButton, True)
+            # The help button is either made visible or hidden when a page is entered, depending
+            # on whether the page declares a `HELP_CONTEXT` value.
+            self.setOption(QWizard.HaveHelpButton, True)
+            self.setOption(QWizard.HelpButtonOnRight, False)
+            # These are looked up on every page change.
+            self._help_button = self.button(QWizard.HelpButton)
+            self._custom_button1 = self.button(QWizard.CustomButton1)
+
+            # This must be connected before the wizard is first shown, as that is when the start
+            # page is entered.
+            self.currentIdChanged.connect(self._event_wizard_page_changed)
+            self.helpRequested.connect(self._event_help_requested)
+
         self.show()
         self.raise_()
 
@@ -62,28 +98,54 @@ class BaseWizard(QWizard):
     # between them.
     # TODO: Look at using `initializePage` and `cleanupPage`.
     def _event_wizard_page_changed(self, page_id: int) -> None:
-        if self._last_page_id:
-            page = self.page(self._last_page_id)
-            if hasattr(page, "on_leave"):
-                page.on_leave()
+        if self._last_page_id is not None:
+            last_page_info = self._page_infos.get(self._last_page_id)
+            if last_page_info is not None and last_page_info.has_on_leave:
+                last_page_info.page.on_leave()
 
         self._last_page_id = page_id
-        page = self.page(page_id)
+        # There is no page for the id -1, which Qt uses when there is no current page.
+        page_info = self._page_infos.get(page_id)
         # Only show the help button if there is help to show for the given page.
-        help_context: Optional[HelpContext] = getattr(page, "HELP_CONTEXT", None)
-        self.button(QWizard.HelpButton).setVisible(help_context is not None)
+        self._help_button.setVisible(page_info is not None and
+            page_info.help_context is not None)
 
-        if hasattr(page, "on_enter"):
-            page.on_enter()
+        if page_info is not None and page_info.has_on_enter:
+            page_info.page.on_enter()
         else:
-            button = self.button(QWizard.CustomButton1)
-            button.setVisible(False)
+            self._custom_button1.setVisible(False)
+
+    def addPage(self, page: QWizardPage) -> int:
+        page_id = super().addPage(page)
+        self._register_page(page_id, page)
+        return page_id
+
+    def setPage(self, page_id: int, page: QWizardPage) -> None:
+        super().setPage(page_id, page)
+        self._register_page(page_id, page)
+
+    def removePage(self, page_id: int) -> None:
+        self._page_infos.pop(page_id, None)
+        super().removePage(page_id)
+
+    def _register_page(self, page_id: int, page: QWizardPage) -> None:
+        # Pages are reused as the user moves back and forth, so what they support is probed once
+        # when they are added rather than every time they are entered or left.
+        self._page_infos[page_id] = WizardPageInfo(page, *_get_page_capabilities(page))
 
     def _event_help_requested(self) -> None:
         page = self.currentPage()
-        help_context: Optional[HelpContext] = getattr(page, "HELP_CONTEXT", None)
+        help_context = self._page_infos[self.currentId()].help_context
         assert help_context is not None
-        h = HelpDialog(page, self.HELP_DIRNAME, help_context.file_name)
+        # The dialog loads and lays out the help document when created, so it is kept for reuse
+        # should the user ask for the same help again.
+        key = (self.HELP_DIRNAME, help_context.file_name)
+        h = self._help_dialogs.get(key)
+        if h is None:
+            h = self._help_dialogs[key] = HelpDialog(page, self.HELP_DIRNAME,
+                help_context.file_name)
+        else:
+            h.reset()
         h.run()
 
 
@@ -38,7 +38,7 @@ import certifi
 from aiorpcx import (
     connect_rs, RPCSession, Notification, BatchError, RPCError, CancelledError, SOCKSError,
     TaskTimeout, TaskGroup, handler_invocation, sleep, ignore_after, timeout_after,
-    SOCKS4a, SOCKS5, SOCKSProxy, SOCKSUserAuth, NewlineFramer
+    SOCKS4a, SOCKS5, SOCKSProxy, SOCKSUserAuth, NewlineFramer, run_in_thread
 )
 from bitcoinx import (
     MissingHeader, IncorrectBits, InsufficientPoW, hex_str_to_hash, hash_to_hex_str,
@@ -62,6 +62,9 @@ if TYPE_CHECKING:
 logger = logs.get_logger("network")
 
 HEADER_SIZE = 80
+# Transactions with more hex characters than this are parsed in a worker thread rather than
+# blocking the event loop. Smaller ones are not worth the thread hand-off.
+THREADED_TX_PARSE_HEX_SIZE = 200 * 1024
 ONE_MINUTE = 60
 ONE_DAY = 24 * 3600
 HEADERS_SUBSCRIBE = 'blockchain.headers.subscribe'
@@ -1149,12 +1152,23 @@ class Network(TriggeredCallbacks):
                 tx_id = hash_to_hex_str(tx_hash)
                 try:
                     tx_hex = task.result()
-                    tx = Transaction.from_hex(tx_hex)
-                    session.logger.debug(f'received tx {tx_id} bytes: {len(tx_hex)//2}')
                 except CancelledError:
                     had_timeout = True
+                    continue
                 except Exception as default_error:
                     logger.exception("fetching transaction %s", tx_id, exc_info=default_error)
+                    continue
+
+                # Cancellation of this coroutine while parsing in a thread is not a timeout, and
+                # is left to propagate.
+                try:
+                    if len(tx_hex) > THREADED_TX_PARSE_HEX_SIZE:
+                        tx = await run_in_thread(Transaction.from_hex, tx_hex)
+                    else:
+                        tx = Transaction.from_hex(tx_hex)
+                    session.logger.debug(f'received tx {tx_id} bytes: {len(tx_hex)//2}')
+                except Exception as default_error:
+                    logger.exception("parsing transaction %s", tx_id, exc_info=default_error)
                 else:
                     wallet.add_transaction(tx_hash, tx, TxFlags.StateCleared | TxFlags.HasByteData,
                         True)
@@ -0,0 +1,114 @@
+from typing import List
+import unittest
+from unittest import mock
+
+from electrumsv.device import Device, DeviceMgr
+from electrumsv.devices.hw_wallet.plugin import HW_PluginBase
+
+
+PRODUCT_KEY = (0x1234, 0x0001)
+
+
+class MockWhatever:
+    pass
+
+
+class MockKeystoreClass:
+    device = "Mock Device"
+
+
+class MockClient:
+    def label(self) -> str:
+        return "mock"
+
+    def is_initialized(self) -> bool:
+        return True
+
+    def has_usable_connection_with_device(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+
+def make_device(id_: str) -> Device:
+    return Device(path=id_.encode(), interface_number=-1, id_=id_, product_key=PRODUCT_KEY,
+        usage_page=0, transport_ui_string='hid')
+
+
+class MockPlugin(HW_PluginBase):
+    keystore_class = MockKeystoreClass
+    libraries_available = True
+    DEVICE_IDS = [ PRODUCT_KEY ]
+
+    def __init__(self, results: List[List[Device]]) -> None:
+        super().__init__("mock")
+        # Each enumeration returns the next result, the last one repeating.
+        self._results = results
+        self.enumeration_count = 0
+
+    def enumerate_devices(self) -> List[Device]:
+        result = self._results[min(self.enumeration_count, len(self._results)-1)]
+        self.enumeration_count += 1
+        return result
+
+    def create_client(self, device: Device, handler) -> MockClient:
+        return MockClient()
+
+
+def make_device_manager(plugin: MockPlugin) -> DeviceMgr:
+    mgr = DeviceMgr()
+    mgr.all_devices = [ "mock" ]
+    mgr.plugins = { "mock": plugin }
+    return mgr
+
+
+@mock.patch('electrumsv.devices.hw_wallet.plugin.time.monotonic')
+class EnumerationCacheTests(unittest.TestCase):
+    def test_reuse_within_ttl(self, monotonic) -> None:
+        plugin = MockPlugin([ [ make_device("a") ] ])
+        monotonic.return_value = 100.0
+        devices1 = plugin.enumerate_devices_cached()
+        monotonic.return_value = 101.0
+        devices2 = plugin.enumerate_devices_cached()
+        self.assertEqual(1, plugin.enumeration_count)
+        self.assertIs(devices1, devices2)
+
+    def test_enumerate_after_ttl(self, monotonic) -> None:
+        plugin = MockPlugin([ [ make_device("a") ], [ make_device("b") ] ])
+        monotonic.return_value = 100.0
+        plugin.enumerate_devices_cached()
+        monotonic.return_value = 100.0 + plugin.enumeration_cache_seconds
+        devices = plugin.enumerate_devices_cached()
+        self.assertEqual(2, plugin.enumeration_count)
+        self.assertEqual([ make_device("b") ], devices)
+
+    def test_scan_devices_fresh(self, monotonic) -> None:
+        plugin = MockPlugin([ [], [ make_device("a") ] ])
+        mgr = make_device_manager(plugin)
+        monotonic.return_value = 100.0
+        self.assertEqual([], mgr.scan_devices())
+        self.assertEqual([], mgr.scan_devices())
+        self.assertEqual(1, plugin.enumeration_count)
+
+        self.assertEqual([ make_device("a") ], mgr.scan_devices(fresh=True))
+        self.assertEqual(2, plugin.enumeration_count)
+
+    def test_select_device_retry_rescans(self, monotonic) -> None:
+        plugin = MockPlugin([ [], [ make_device("a") ] ])
+        mgr = make_device_manager(plugin)
+        monotonic.return_value = 100.0
+        # Cache the empty enumeration, as a prior scan within the TTL would have.
+        mgr.scan_devices()
+
+        questions = []
+        handler = MockWhatever()
+        def _yes_no_question(msg: str) -> bool:
+            questions.append(msg)
+            return True
+        handler.yes_no_question = _yes_no_question
+
+        info = mgr.select_device(plugin, handler, MockWhatever())
+        self.assertEqual(1, len(questions))
+        self.assertEqual(2, plugin.enumeration_count)
+        self.assertEqual(make_device("a"), info.device)
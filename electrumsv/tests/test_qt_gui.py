@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import List, Optional, Tuple
 import unittest
 
 from electrumsv.i18n import _
@@ -105,3 +105,174 @@ class HistoryListTests(unittest.TestCase):
         self.assertNotEqual("...", time_string)
         self.assertEqual(time_string, get_tx_desc(TxStatus.FINAL, 1))
         self.assertEqual(_("unknown"), get_tx_desc(TxStatus.FINAL, False))
+
+
+class BaseWizardTests(unittest.TestCase):
+    def test_page_changed_leaves_page_id_zero(self) -> None:
+        from electrumsv.gui.qt.wizard_common import BaseWizard
+
+        events: List[Tuple[str, int]] = []
+        class MockPage:
+            def __init__(self, page_id: int) -> None:
+                self.page_id = page_id
+            def on_enter(self) -> None:
+                events.append(("enter", self.page_id))
+            def on_leave(self) -> None:
+                events.append(("leave", self.page_id))
+
+        wizard = MockWhatever()
+        wizard._last_page_id = None
+        wizard._page_infos = {}
+        wizard._help_button = MockWhatever()
+        wizard._help_button.setVisible = lambda visible: None
+        for page_id in (0, 1):
+            BaseWizard._register_page(wizard, page_id, MockPage(page_id))
+
+        for page_id in (0, 1, 0):
+            BaseWizard._event_wizard_page_changed(wizard, page_id)
+        self.assertEqual([ ("enter", 0), ("leave", 0), ("enter", 1), ("leave", 1),
+            ("enter", 0) ], events)
+
+
+def _legacy_numbify_filter(text: str, decimal_point: int) -> str:
+    # The character filter `AmountEdit.numbify` used before it was precompiled.
+    text = text.strip()
+    chars = '0123456789.'
+    s = ''.join([i for i in text if i in chars])
+    if '.' in s:
+        p = s.find('.')
+        s = s.replace('.','')
+        s = s[:p] + '.' + s[p: p + decimal_point]
+    return s
+
+
+class AmountEditTests(unittest.TestCase):
+    def test_clean_amount_text_matches_legacy_filter(self) -> None:
+        from electrumsv.gui.qt.amountedit import clean_amount_text
+
+        for text in ("", "123", " 1.5 ", "1,000.25 BSV", "abc", "1a2b3", "1.2.3.4", "..5",
+                "5..", "0.123456789", "12.345", "1!2", "!!"):
+            for decimal_point in (0, 2, 8):
+                self.assertEqual(_legacy_numbify_filter(text, decimal_point),
+                    clean_amount_text(text, decimal_point), (text, decimal_point))
+
+    def test_clean_amount_text_caps_decimal_places(self) -> None:
+        from electrumsv.gui.qt.amountedit import clean_amount_text
+
+        self.assertEqual("1.12345678", clean_amount_text("1.123456789", 8))
+        self.assertEqual("1.12", clean_amount_text("1.1.2.3", 2))
+        self.assertEqual("1.", clean_amount_text("1.5", 0))
+        # The '!' shortcut is recognised by `numbify` before the text is cleaned.
+        self.assertEqual("", clean_amount_text("!", 8))
+
+
+class PayToEditParseCacheTests(unittest.TestCase):
+    def _make_edit(self) -> Tuple[MockWhatever, List[str], List[str]]:
+        from bitcoinx import Script
+        from electrumsv.exceptions import InvalidPayToError
+
+        parsed: List[str] = []
+        warned: List[str] = []
+        def _parse_output(text: str) -> Script:
+            parsed.append(text)
+            if text.startswith("bad"):
+                raise InvalidPayToError(f"invalid {text}")
+            return Script(text.encode())
+
+        edit = MockWhatever()
+        edit._parse_cache = {}
+        edit._parse_output = _parse_output
+        edit._show_cashaddr_warning = warned.append
+        return edit, parsed, warned
+
+    def test_hit_returns_cached_script(self) -> None:
+        from electrumsv.gui.qt.paytoedit import PayToEdit
+
+        edit, parsed, warned = self._make_edit()
+        script = PayToEdit._parse_output_cached(edit, "good")
+        self.assertIs(script, PayToEdit._parse_output_cached(edit, "good"))
+        self.assertEqual([ "good" ], parsed)
+        # The cash address check is still made for the cached result.
+        self.assertEqual([ "good", "good" ], warned)
+
+    def test_hit_reraises_cached_error(self) -> None:
+        from electrumsv.exceptions import InvalidPayToError
+        from electrumsv.gui.qt.paytoedit import PayToEdit
+
+        edit, parsed, warned = self._make_edit()
+        for _attempt in range(2):
+            with self.assertRaises(InvalidPayToError) as context:
+                PayToEdit._parse_output_cached(edit, "bad1")
+            self.assertEqual("invalid bad1", context.exception.args[0])
+        self.assertEqual([ "bad1" ], parsed)
+        self.assertEqual([], warned)
+
+    def test_cache_cleared_when_full(self) -> None:
+        from electrumsv.gui.qt.paytoedit import MAX_PARSE_CACHE_ENTRIES, PayToEdit
+
+        edit, parsed, warned = self._make_edit()
+        for i in range(MAX_PARSE_CACHE_ENTRIES):
+            PayToEdit._parse_output_cached(edit, f"good{i}")
+        self.assertEqual(MAX_PARSE_CACHE_ENTRIES, len(edit._parse_cache))
+        PayToEdit._parse_output_cached(edit, "extra")
+        self.assertEqual({ "extra" }, set(edit._parse_cache))
+
+
+class MockTimer:
+    def __init__(self) -> None:
+        self._active = False
+    def start(self) -> None:
+        self._active = True
+    def stop(self) -> None:
+        self._active = False
+    def isActive(self) -> bool:
+        return self._active
+
+
+class PayToEditReparseTests(unittest.TestCase):
+    def test_get_outputs_flushes_pending_edit(self) -> None:
+        import types
+        from bitcoinx import Address
+        from electrumsv.gui.qt.paytoedit import PayToEdit
+        from electrumsv.networks import Net
+
+        amounts: List[Optional[int]] = []
+        send_view = MockWhatever()
+        send_view.amount_e = MockWhatever()
+        send_view.amount_e.decimal_point = lambda: 8
+        send_view.amount_e.get_amount = lambda: amounts[-1] if amounts else None
+        send_view.amount_e.setAmount = amounts.append
+        send_view.set_is_spending_maximum = lambda is_max: None
+        send_view.get_is_spending_maximum = lambda: False
+        send_view.lock_amount = lambda locked: None
+
+        edit = MockWhatever()
+        edit._send_view = send_view
+        edit._reparse_timer = MockTimer()
+        edit._parse_cache = {}
+        edit._outputs = []
+        edit._errors = []
+        edit._payto_script = None
+        edit._last_text = None
+        edit._lines_cache = None
+        edit._ignore_uris = False
+        edit.is_pr = False
+        edit._show_cashaddr_warning = lambda text: None
+        for name in ("_on_text_changed", "_flush_reparse", "_do_reparse", "get_outputs",
+                "_lines", "_parse_tx_output", "_parse_output_cached", "_parse_output",
+                "_parse_amount"):
+            setattr(edit, name, types.MethodType(getattr(PayToEdit, name), edit))
+
+        address_string = "1GPHVTY8UD9my6jyP4tb2TYJwUbDetyNC6"
+        text = f"{address_string}, 1.5\n{address_string}, 2"
+        edit.toPlainText = lambda: text
+        # This is what a user edit does, the parse itself is left for the timer.
+        edit._on_text_changed()
+        self.assertEqual([], edit._outputs)
+
+        outputs = edit.get_outputs(False)
+        self.assertFalse(edit._reparse_timer.isActive())
+        script = Address.from_string(address_string, Net.COIN).to_script()
+        self.assertEqual([ (150000000, script), (200000000, script) ],
+            [ (output.value, output.script_pubkey) for output in outputs ])
+        self.assertEqual([ 350000000 ], amounts)
@@ -1,6 +1,8 @@
 import asyncio
+from functools import lru_cache
 import json
 import logging
+from operator import attrgetter
 import os
 import shutil
 import sys
@@ -20,10 +22,9 @@ from electrumsv.networks import Net, SVMainnet, SVTestnet
 from electrumsv.storage import get_categorised_files, WalletStorage, WalletStorageInfo
 from electrumsv.wallet import (ImportedPrivkeyAccount, ImportedAddressAccount, MultisigAccount,
     Wallet, StandardAccount, AbstractAccount)
-from electrumsv.wallet_database import DatabaseContext
 from electrumsv.wallet_database.tables import AccountRow, KeyInstanceRow, TransactionDeltaTable
 
-from .util import setup_async, tear_down_async, TEST_WALLET_PATH
+from .util import get_test_db_context, setup_async, tear_down_async, TEST_WALLET_PATH
 
 
 class _TestableWallet(Wallet):
@@ -31,12 +32,17 @@ class _TestableWallet(Wallet):
         return self.__class__.__name__
 
 class MockStorage:
-    def __init__(self) -> None:
-        self.path = tempfile.mktemp()
-
-        from electrumsv.wallet_database.migration import create_database_file, update_database_file
-        create_database_file(self.path)
-        update_database_file(self.path)
+    def __init__(self, path: Optional[str]=None, template_path: Optional[str]=None) -> None:
+        self.path = tempfile.mktemp() if path is None else path
+
+        if template_path is None:
+            from electrumsv.wallet_database.migration import (create_database_file,
+                update_database_file)
+            create_database_file(self.path)
+            update_database_file(self.path)
+        else:
+            # Copying an already migrated database is much cheaper than recreating the schema.
+            shutil.copyfile(template_path + DATABASE_EXT, self.path + DATABASE_EXT)
 
         self._data = {}
 
@@ -53,7 +59,7 @@ class MockStorage:
         return self.path
 
     def get_db_context(self):
-        return DatabaseContext(self.path)
+        return get_test_db_context(self.path)
 
 
 def setUpModule():
@@ -64,15 +70,29 @@ def tearDownModule():
     tear_down_async()
 
 
+@lru_cache(maxsize=None)
 def get_categorised_files2(wallet_path: str) -> List[WalletStorageInfo]:
     matches = get_categorised_files(wallet_path)
     # In order to ensure ordering consistency, we sort the files.
-    return sorted(matches, key=lambda v: v.filename)
+    return sorted(matches, key=attrgetter("filename"))
+
 
+@pytest.fixture(scope="session")
+def _storage_template(tmp_path_factory) -> str:
+    storage = MockStorage(str(tmp_path_factory.mktemp("template") / "wallet"))
+    return storage.get_path()
 
 @pytest.fixture()
-def tmp_storage(tmpdir):
-    return MockStorage()
+def tmp_storage(_storage_template, tmp_path):
+    return MockStorage(str(tmp_path / "wallet"), _storage_template)
+
+@pytest.fixture
+def storage_network(storage_info: WalletStorageInfo):
+    # "<expected version>_<network>_<type>[_<subtype>]"
+    network = SVTestnet if storage_info.filename.split("_")[1] == "testnet" else SVMainnet
+    Net.set_to(network)
+    yield network
+    Net.set_to(SVMainnet)
 
 @pytest.fixture(params=[SVMainnet, SVTestnet])
 def network(request):
@@ -92,13 +112,10 @@ class FakeSynchronizer(object):
 
 
 class WalletTestCase(unittest.TestCase):
-    def setUp(self):
-        self.user_dir = tempfile.mkdtemp()
-        self.wallet_path = os.path.join(self.user_dir,
-            f"somewallet-{os.urandom(4).hex()}")
-
-    def tearDown(self):
-        shutil.rmtree(self.user_dir)
+    @pytest.fixture(autouse=True)
+    def _user_dir(self, tmp_path) -> None:
+        self.user_dir = str(tmp_path)
+        self.wallet_path = os.path.join(self.user_dir, "somewallet")
 
 
 def check_legacy_parent_of_standard_wallet(wallet: Wallet,
@@ -297,6 +314,11 @@ def check_create_keys(wallet: Wallet, account_script_type: ScriptType) -> None:
 # wallet, and account. And that the underlying data for keystore and wallet persistence
 # is also exported correctly.
 class TestLegacyWalletCreation:
+    @pytest.fixture
+    def mock_app_state(self):
+        with unittest.mock.patch('electrumsv.wallet.app_state') as mock_app_state:
+            yield mock_app_state
+
     def test_standard_electrum(self, tmp_storage) -> None:
         password = 'password'
         seed_words = 'cycle rocket west magnet parrot shuffle foot correct salt library feed song'
@@ -341,7 +363,6 @@ class TestLegacyWalletCreation:
 
         check_create_keys(wallet, account_row.default_script_type)
 
-    @unittest.mock.patch('electrumsv.wallet.app_state')
     def test_imported_privkey(self, mock_app_state, tmp_storage) -> None:
         mock_app_state.app = unittest.mock.Mock()
         wallet = Wallet(tmp_storage)
@@ -356,7 +377,6 @@ class TestLegacyWalletCreation:
         check_legacy_parent_of_imported_privkey_wallet(wallet, keypairs=keypairs,
             password='password')
 
-    @unittest.mock.patch('electrumsv.wallet.app_state')
     def test_imported_pubkey(self, mock_app_state, tmp_storage) -> None:
         text = """
         15hETetDmcXm1mM4sEf7U2KXC9hDHFMSzz
@@ -396,8 +416,10 @@ class TestLegacyWalletCreation:
         check_create_keys(wallet, account_row.default_script_type)
 
 
-@pytest.mark.parametrize("storage_info", get_categorised_files2(TEST_WALLET_PATH))
-def test_legacy_wallet_loading(storage_info: WalletStorageInfo) -> None:
+@pytest.mark.parametrize("storage_info", get_categorised_files2(TEST_WALLET_PATH),
+    ids=lambda storage_info: storage_info.filename)
+def test_legacy_wallet_loading(storage_info: WalletStorageInfo, storage_network,
+        tmp_path) -> None:
     # When a wallet is composed of multiple files, we need to know which to load.
     wallet_filenames = []
     if storage_info.kind != StorageKind.DATABASE:
@@ -405,7 +427,7 @@ def test_legacy_wallet_loading(storage_info: WalletStorageInfo) -> None:
     if storage_info.kind in (StorageKind.DATABASE, StorageKind.HYBRID):
         wallet_filenames.append(storage_info.filename + DATABASE_EXT)
 
-    temp_dir = tempfile.mkdtemp()
+    temp_dir = str(tmp_path)
     for _wallet_filename in wallet_filenames:
         source_wallet_path = os.path.join(TEST_WALLET_PATH, _wallet_filename)
         wallet_path = os.path.join(temp_dir, _wallet_filename)
@@ -418,9 +440,6 @@ def test_legacy_wallet_loading(storage_info: WalletStorageInfo) -> None:
         = wallet_filename.split("_")
     expected_version = int(expected_version_text)
 
-    if "testnet" == expected_network:
-        Net.set_to(SVTestnet)
-
     if storage_info.kind == StorageKind.HYBRID:
         pytest.xfail("old development database wallets not supported yet")
 
@@ -478,9 +497,6 @@ def test_legacy_wallet_loading(storage_info: WalletStorageInfo) -> None:
     else:
         raise Exception(f"unrecognised wallet file {wallet_filename}")
 
-    if "testnet" == expected_network:
-        Net.set_to(SVMainnet)
-
 
 def test_detect_used_keys(mocker):
     class MockDatabaseContext:
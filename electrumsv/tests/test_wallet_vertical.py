@@ -8,11 +8,10 @@ from electrumsv.constants import ScriptType
 from electrumsv import keystore
 from electrumsv.keystore import Multisig_KeyStore
 from electrumsv.networks import Net, SVMainnet
-from electrumsv import wallet_database
 from electrumsv.wallet import MultisigAccount, StandardAccount, Wallet
 from electrumsv.wallet_database.tables import AccountRow
 
-from .util import setup_async, tear_down_async
+from .util import get_test_db_context, setup_async, tear_down_async
 
 
 def setUpModule():
@@ -47,7 +46,7 @@ class MockStorage:
         return self.path
 
     def get_db_context(self):
-        return wallet_database.DatabaseContext(self.path)
+        return get_test_db_context(self.path)
 
 
 class TestWalletKeystoreAddressIntegrity(unittest.TestCase):
@@ -2,6 +2,7 @@ import os
 
 from electrumsv.simple_config import SimpleConfig
 from electrumsv.app_state import AppStateProxy
+from electrumsv.wallet_database.sqlite_support import DatabaseContext, SynchronousModes
 
 
 class AppStateProxyTest(AppStateProxy):
@@ -25,3 +26,12 @@ def tear_down_async():
 
 TEST_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 TEST_WALLET_PATH = os.path.join(TEST_DATA_PATH, "wallets")
+
+
+class FastDatabaseContext(DatabaseContext):
+    # Test databases are transient, so there is no need to wait for writes to reach the disk.
+    SYNCHRONOUS_MODE = SynchronousModes.OFF
+
+
+def get_test_db_context(wallet_path: str) -> DatabaseContext:
+    return FastDatabaseContext(wallet_path)
@@ -25,6 +25,7 @@
 from collections import defaultdict
 from decimal import Decimal
 from datetime import datetime
+from functools import lru_cache
 import json
 import hmac
 import os
@@ -536,7 +537,10 @@ def setup_thread_excepthook():
 def get_wallet_name_from_path(wallet_path: str) -> str:
     return os.path.splitext(os.path.basename(wallet_path))[0]
 
-def versiontuple(v: str) -> Sequence[int]:
+@lru_cache(maxsize=64)
+def versiontuple(v: str) -> Tuple[int, ...]:
+    # Version strings come from a small fixed set of libraries and firmwares, and the tuple is
+    # immutable so the parsed result can be shared.
     return tuple(int(x) for x in v.split("."))
 
 def resource_path(*parts: Sequence[str]) -> str:
@@ -227,9 +227,25 @@ class JournalModes(Enum):
     OFF = "OFF"
 
 
+class SynchronousModes(Enum):
+    OFF = "OFF"
+    NORMAL = "NORMAL"
+    FULL = "FULL"
+    EXTRA = "EXTRA"
+
+
 class DatabaseContext:
     MEMORY_PATH = ":memory:"
     JOURNAL_MODE = JournalModes.WAL
+    # If not set the SQLite default is used, which is the most durable `FULL` mode.
+    SYNCHRONOUS_MODE: Optional[SynchronousModes] = None
+    # The sqlite3 module caches compiled statements per connection, but only 128 by default. The
+    # table classes have most of that in fixed statements, and every distinct batch size of the
+    # `IN (?, ...)` id queries is a statement of its own.
+    STATEMENT_CACHE_SIZE = 512
+    # Reads of wallet database files are done through memory-mapped I/O up to this many bytes,
+    # avoiding a read system call for pages already in the operating system's cache.
+    MMAP_SIZE = 256 * 1024 * 1024
 
     SQLITE_CONN_POOL_SIZE = 0
 
@@ -267,13 +283,17 @@ class DatabaseContext:
         # debug_text = traceback.format_stack()
         is_special_path = self.is_special_path(self._db_path)
         connection = sqlite3.connect(self._db_path, check_same_thread=False,
-            isolation_level=None, uri=is_special_path)
+            isolation_level=None, uri=is_special_path,
+            cached_statements=self.STATEMENT_CACHE_SIZE)
         connection.execute("PRAGMA busy_timeout=5000;")
         connection.execute("PRAGMA foreign_keys=ON;")
+        if self.SYNCHRONOUS_MODE is not None:
+            connection.execute(f"PRAGMA synchronous={self.SYNCHRONOUS_MODE.value};")
         # We do not enable journaling for in-memory databases. It resulted in 'database is locked'
         # errors. Perhaps it works now with the locking and backoff retries.
         if not self.is_special_path(self._db_path):
             self._ensure_journal_mode(connection)
+            connection.execute(f"PRAGMA mmap_size={self.MMAP_SIZE};")
 
         # self._debug_texts[connection] = debug_text
         self._connection_pool.put(connection)